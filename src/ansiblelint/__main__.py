@@ -31,6 +31,7 @@ import site
 import subprocess
 import sys
 from contextlib import contextmanager
+from dataclasses import fields
 from typing import TYPE_CHECKING, Any, Callable, TextIO
 
 from ansible_compat.config import ansible_version
@@ -47,7 +48,13 @@ from ansiblelint.color import (
     reconfigure,
     render_yaml,
 )
-from ansiblelint.config import Options, get_version_warning, log_entries, options
+from ansiblelint.config import (
+    Options,
+    _refresh_version_cache_async,
+    get_version_warning,
+    log_entries,
+    options,
+)
 from ansiblelint.constants import GIT_CMD, RC
 from ansiblelint.file_utils import abspath, cwd, normpath
 from ansiblelint.loaders import load_ignore_txt
@@ -112,8 +119,8 @@ def initialize_options(arguments: list[str] | None = None) -> None:
         new_options.colored = should_do_markup()
 
     # persist loaded configuration inside options module
-    for k, v in new_options.__dict__.items():
-        setattr(options, k, v)
+    for field in fields(new_options):
+        setattr(options, field.name, getattr(new_options, field.name))
 
     # rename deprecated ids/tags to newer names
     options.tags = [normalize_tag(tag) for tag in options.tags]
@@ -254,6 +261,11 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901
         options.tags = options.tags.split(",")  # pragma: no cover
     result = _get_matches(rules, options)
 
+    # let the release check overlap with transforms and reporting; it is only
+    # started after linting so the thread is never inherited by forked workers
+    if not options.offline and os.environ.get("PRE_COMMIT", "0") != "1":
+        _refresh_version_cache_async()
+
     if options.write_list:
         _do_transform(result, options)
 
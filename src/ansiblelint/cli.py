@@ -444,6 +444,12 @@ def get_cli_parser() -> argparse.ArgumentParser:
         const=True,
         help="Disable installation of requirements.yml and schema refreshing",
     )
+    parser.add_argument(
+        "--processes",
+        dest="processes",
+        type=int,
+        help="Number of processes used to run rules against files, 0 uses all available CPUs. Default: 1",
+    )
     parser.add_argument(
         "--version",
         action="store_true",
@@ -490,6 +496,11 @@ def merge_config(file_config: dict[Any, Any], cli_config: Options) -> Options:
         "sarif_file": None,
     }
 
+    # 0 is a valid number of processes (all cpus), so only None means unset
+    file_processes = file_config.pop("processes", None) if file_config else None
+    if cli_config.processes is None:
+        cli_config.processes = 1 if file_processes is None else file_processes
+
     if not file_config:
         # use defaults if we don't have a config file and the commandline
         # parameter is not set
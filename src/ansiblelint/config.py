@@ -1,20 +1,18 @@
 """Store configuration options as a singleton."""
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
 import sys
+import threading
 import time
-import urllib.request
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from urllib.error import HTTPError, URLError
-
-from packaging.version import Version
 
 from ansiblelint import __version__
 from ansiblelint.loaders import yaml_from_file
@@ -27,8 +25,13 @@ _logger = logging.getLogger(__name__)
 
 
 CACHE_DIR = (
-    os.path.expanduser(os.environ.get("XDG_CACHE_HOME", "~/.cache")) + "/ansible-lint"
+    Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "ansible-lint"
 )
+CACHE_FILE = CACHE_DIR / "latest.json"
+# seconds to wait at exit for a background release check to complete
+VERSION_CHECK_EXIT_TIMEOUT = 2
+# location of pip --user installations
+_USER_LOCAL_LIB = os.path.expanduser("~/.local/lib")
 
 DEFAULT_WARN_LIST = [
     "experimental",
@@ -98,8 +101,11 @@ PROFILES = yaml_from_file(Path(__file__).parent / "data" / "profiles.yml")
 
 LOOP_VAR_PREFIX = "^(__|{role}_)"
 
+# slots are only supported by dataclasses starting with python 3.10
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Options:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
     """Store ansible-lint effective configuration options."""
 
@@ -121,7 +127,7 @@ class Options:  # pylint: disable=too-many-instance-attributes,too-few-public-me
     tags: list[str] = field(default_factory=list)
     verbosity: int = 0
     warn_list: list[str] = field(default_factory=list)
-    kinds = DEFAULT_KINDS
+    kinds: list[dict[str, str]] = field(default_factory=lambda: DEFAULT_KINDS)
     mock_filters: list[str] = field(default_factory=list)
     mock_modules: list[str] = field(default_factory=list)
     mock_roles: list[str] = field(default_factory=list)
@@ -130,6 +136,7 @@ class Options:  # pylint: disable=too-many-instance-attributes,too-few-public-me
     only_builtins_allow_modules: list[str] = field(default_factory=list)
     var_naming_pattern: str | None = None
     offline: bool = False
+    processes: int = 1  # number of processes used to run rules, 0 uses all cpus
     project_dir: str = "."  # default should be valid folder (do not use None here)
     extra_vars: dict[str, Any] | None = None
     enable_list: list[str] = field(default_factory=list)
@@ -149,6 +156,18 @@ class Options:  # pylint: disable=too-many-instance-attributes,too-few-public-me
     version: bool = False  # display version command
     list_profiles: bool = False  # display profiles command
     ignore_file: Path | None = None
+    progressive: bool = False  # removed feature, still accepted by config schema
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling, without the lock owned by this process."""
+        state = {option.name: getattr(self, option.name) for option in fields(self)}
+        state["cache_dir_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore state from pickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
 
 
 options = Options()
@@ -172,19 +191,24 @@ def get_rule_config(rule_id: str) -> dict[str, Any]:
     return rule_config
 
 
-@lru_cache
+# Collection path variable for current version of Ansible, respecting Ansible
+# behavior, which is to load old name if present.
+ANSIBLE_COLLECTIONS_PATH_ENV = next(
+    (
+        env_var
+        for env_var in ("ANSIBLE_COLLECTIONS_PATHS", "ANSIBLE_COLLECTIONS_PATH")
+        if env_var in os.environ
+    ),
+    "ANSIBLE_COLLECTIONS_PATH",
+)
+
+
 def ansible_collections_path() -> str:
     """Return collection path variable for current version of Ansible."""
-    # respect Ansible behavior, which is to load old name if present
-    for env_var in [
-        "ANSIBLE_COLLECTIONS_PATHS",
-        "ANSIBLE_COLLECTIONS_PATH",
-    ]:  # pragma: no cover
-        if env_var in os.environ:
-            return env_var
-    return "ANSIBLE_COLLECTIONS_PATH"
+    return ANSIBLE_COLLECTIONS_PATH_ENV
 
 
+@lru_cache(maxsize=1)
 def in_venv() -> bool:
     """Determine whether Python is running from a venv."""
     if hasattr(sys, "real_prefix") or os.environ.get("CONDA_EXE", None) is not None:
@@ -194,6 +218,7 @@ def in_venv() -> bool:
     return pfx != sys.prefix
 
 
+@lru_cache(maxsize=1)
 def guess_install_method() -> str:
     """Guess if pip upgrade command should be used."""
     package_name = "ansible-lint"
@@ -201,7 +226,7 @@ def guess_install_method() -> str:
     if in_venv():
         _logger.debug("Found virtualenv, assuming `pip3 install` will work.")
         pip = f"pip install --upgrade {package_name}"
-    elif __file__.startswith(os.path.expanduser("~/.local/lib")):
+    elif __file__.startswith(_USER_LOCAL_LIB):
         _logger.debug(
             "Found --user installation, assuming `pip3 install --user` will work.",
         )
@@ -225,8 +250,12 @@ def guess_install_method() -> str:
             dist = get_default_environment().get_distribution(package_name)
             if dist:
                 logging.debug("Found %s dist", dist)
-                for _ in uninstallation_paths(dist):
+                # a single path is enough to know pip can uninstall it
+                try:
+                    next(uninstallation_paths(dist))
                     use_pip = True
+                except StopIteration:
+                    use_pip = False
             else:
                 logging.debug("Skipping %s as it is not installed.", package_name)
                 use_pip = False
@@ -240,43 +269,96 @@ def guess_install_method() -> str:
     return pip if use_pip else ""
 
 
+def _read_version_cache() -> tuple[dict[str, Any], bool]:
+    """Return cached details about latest release and if they are still fresh."""
+    try:
+        # a single stat call tells us both if the cache exists and its age
+        fresh = time.time() - os.stat(CACHE_FILE).st_mtime < 24 * 60 * 60
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f), fresh
+    except (OSError, ValueError):
+        # missing or partially written cache file
+        return {}, False
+
+
+def _refresh_version_cache() -> None:
+    """Fetch details about latest release and store them inside the cache."""
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+    import urllib.request
+
+    release_url = "https://api.github.com/repos/ansible/ansible-lint/releases/latest"
+    try:
+        with urllib.request.urlopen(release_url, timeout=5) as url:  # noqa: S310
+            data = json.load(url)
+    # URLError and timeouts are OSError, invalid replies raise ValueError
+    except (OSError, ValueError) as exc:  # pragma: no cover
+        _logger.debug(
+            "Unable to fetch latest version from %s due to: %s",
+            release_url,
+            exc,
+        )
+        return
+    # replace the cache atomically, so readers and concurrent writers never
+    # see a truncated file
+    tmp_file = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=CACHE_DIR,
+            prefix=".latest-",
+            suffix=".json",
+            delete=False,
+        ) as f:
+            tmp_file = f.name
+            json.dump(data, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as exc:  # pragma: no cover
+        _logger.debug("Unable to write %s due to: %s", CACHE_FILE, exc)
+        if tmp_file:
+            Path(tmp_file).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=1)
+def _refresh_version_cache_async() -> threading.Thread | None:
+    """Refresh a stale version cache in background, at most once per run."""
+    if options.offline or _read_version_cache()[1]:
+        return None
+    thread = threading.Thread(
+        target=_refresh_version_cache,
+        name="ansible-lint-version-check",
+        daemon=True,
+    )
+    thread.start()
+    # daemon threads are killed at exit, give the refresh a chance to finish
+    atexit.register(thread.join, VERSION_CHECK_EXIT_TIMEOUT)
+    return thread
+
+
+@lru_cache
 def get_version_warning() -> str:
     """Display warning if current version is outdated."""
     # 0.1dev1 is special fallback version
     if __version__ == "0.1.dev1":  # pragma: no cover
         return ""
+    # on offline mode we do not want to check for updates.
+    if options.offline:
+        return ""
+
+    # pylint: disable=import-outside-toplevel
+    from packaging.version import Version
 
     msg = ""
-    data = {}
     current_version = Version(__version__)
 
-    if not os.path.exists(CACHE_DIR):  # pragma: no cover
-        os.makedirs(CACHE_DIR)
-    cache_file = f"{CACHE_DIR}/latest.json"
-    refresh = True
-    if os.path.exists(cache_file):
-        age = time.time() - os.path.getmtime(cache_file)
-        if age < 24 * 60 * 60:
-            refresh = False
-        with open(cache_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-    if refresh or not data:
-        release_url = (
-            "https://api.github.com/repos/ansible/ansible-lint/releases/latest"
-        )
-        try:
-            with urllib.request.urlopen(release_url) as url:  # noqa: S310
-                data = json.load(url)
-                with open(cache_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f)
-        except (URLError, HTTPError) as exc:  # pragma: no cover
-            _logger.debug(
-                "Unable to fetch latest version from %s due to: %s",
-                release_url,
-                exc,
-            )
-            return ""
+    # never wait for the network, a stale cache is refreshed for next runs
+    data, fresh = _read_version_cache()
+    if not fresh:
+        _refresh_version_cache_async()
+    if not data:
+        return ""
 
     html_url = data["html_url"]
     new_version = Version(data["tag_name"][1:])  # removing v prefix from tag
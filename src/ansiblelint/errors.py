@@ -21,6 +21,15 @@ class StrictModeError(RuntimeError):
         super().__init__(message)
 
 
+def _new_match_error(cls: type[MatchError]) -> MatchError:
+    """Create an uninitialized match error, its state is restored by pickle."""
+    return cls.__new__(cls)
+
+
+class RuleMatchTransformMeta:  # pylint: disable=too-few-public-methods
+    """Additional metadata about a match error to be used during transformation."""
+
+
 # pylint: disable=too-many-instance-attributes
 @dataclass(unsafe_hash=True)
 @functools.total_ordering
@@ -48,6 +57,7 @@ class MatchError(ValueError):
     rule: BaseRule = field(hash=False, default=RuntimeErrorRule())
     ignored: bool = False
     fixed: bool = False  # True when a transform has resolved this MatchError
+    transform_meta: RuleMatchTransformMeta | None = field(hash=False, default=None)
 
     def __post_init__(self) -> None:
         """Can be use by rules that can report multiple errors type, so we can still filter by them."""
@@ -87,6 +97,10 @@ class MatchError(ValueError):
             msg = "MatchError called incorrectly as column numbers start with 1"
             raise RuntimeError(msg)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Allow pickling, as exceptions are unpickled by calling their class without arguments."""
+        return (_new_match_error, (self.__class__,), self.__dict__)
+
     @functools.cached_property
     def level(self) -> str:
         """Return the level of the rule: error, warning or notice."""
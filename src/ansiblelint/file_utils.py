@@ -4,15 +4,17 @@ from __future__ import annotations
 import copy
 import logging
 import os
+import re
 import subprocess
 import sys
 from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING, Any, cast
 
-import wcmatch.pathlib
+import wcmatch.glob
 from wcmatch.wcmatch import RECURSIVE, WcMatch
 from yaml.error import YAMLError
 
@@ -126,27 +128,45 @@ def expand_paths_vars(paths: list[str]) -> list[str]:
     return paths
 
 
+@lru_cache(maxsize=None)
+def kind_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a kind glob pattern into a regular expression, only once."""
+    # pathlib.Path.match patterns are very limited, they do not support *a*.yml
+    # glob.glob supports **/foo.yml but not multiple extensions
+    include, _ = wcmatch.glob.translate(
+        pattern,
+        flags=wcmatch.glob.GLOBSTAR | wcmatch.glob.BRACE | wcmatch.glob.DOTGLOB,
+    )
+    return re.compile("|".join(include))
+
+
+@lru_cache(maxsize=None)
+def kinds_patterns(
+    kinds: tuple[tuple[str, str], ...],
+) -> tuple[tuple[str, re.Pattern[str]], ...]:
+    """Return compiled patterns for a list of kinds, computed once per list."""
+    return tuple((kind, kind_pattern(pattern)) for kind, pattern in kinds)
+
+
+def kind_for(path: str, kinds: list[dict[str, str]]) -> str:
+    """Return the kind of the first pattern matching the path, or empty string."""
+    entries = tuple((str(k), v) for entry in kinds for k, v in entry.items())
+    for kind, pattern in kinds_patterns(entries):
+        if pattern.match(path):
+            return kind
+    return ""
+
+
 def kind_from_path(path: Path, base: bool = False) -> FileType:
     """Determine the file kind based on its name.
 
     When called with base=True, it will return the base file type instead
     of the explicit one. That is expected to return 'yaml' for any yaml files.
     """
-    # pathlib.Path.match patterns are very limited, they do not support *a*.yml
-    # glob.glob supports **/foo.yml but not multiple extensions
-    pathex = wcmatch.pathlib.PurePath(str(path.absolute().resolve()))
-    kinds = options.kinds if not base else BASE_KINDS
-    for entry in kinds:
-        for k, v in entry.items():
-            if pathex.globmatch(
-                v,
-                flags=(
-                    wcmatch.pathlib.GLOBSTAR
-                    | wcmatch.pathlib.BRACE
-                    | wcmatch.pathlib.DOTGLOB
-                ),
-            ):
-                return str(k)  # type: ignore[return-value]
+    pathex = str(path.absolute().resolve())
+    kind = kind_for(pathex, options.kinds if not base else BASE_KINDS)
+    if kind:
+        return kind  # type: ignore[return-value]
 
     if base:
         # Unknown base file type is default
@@ -356,6 +376,12 @@ class Lintable:
         """Return user friendly representation of a lintable."""
         return f"{self.name} ({self.kind})"
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling, without the stdin temporary file handle."""
+        state = self.__dict__.copy()
+        state.pop("file", None)
+        return state
+
     @property
     def data(self) -> Any:
         """Return loaded data representation for current file, if possible."""
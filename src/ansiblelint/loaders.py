@@ -30,7 +30,7 @@ _logger = logging.getLogger(__name__)
 def yaml_from_file(filepath: str | Path) -> Any:
     """Return a loaded YAML file."""
     with open(str(filepath), encoding="utf-8") as content:
-        return yaml_load(content)
+        return yaml_load_safe(content)
 
 
 def load_ignore_txt(filepath: Path | None = None) -> dict[str, set[str]]:
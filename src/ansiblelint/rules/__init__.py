@@ -25,7 +25,7 @@ from ansiblelint._internal.rules import (
 from ansiblelint.config import PROFILES, Options, get_rule_config
 from ansiblelint.config import options as default_options
 from ansiblelint.constants import LINE_NUMBER_KEY, RULE_DOC_URL, SKIPPED_RULES_KEY
-from ansiblelint.errors import MatchError
+from ansiblelint.errors import MatchError, RuleMatchTransformMeta
 from ansiblelint.file_utils import Lintable, expand_paths_vars
 
 if TYPE_CHECKING:
@@ -77,6 +77,7 @@ class AnsibleLintRule(BaseRule):
         details: str = "",
         filename: Lintable | None = None,
         tag: str = "",
+        transform_meta: RuleMatchTransformMeta | None = None,
     ) -> MatchError:
         """Instantiate a new MatchError."""
         match = MatchError(
@@ -86,6 +87,7 @@ class AnsibleLintRule(BaseRule):
             lintable=filename or Lintable(""),
             rule=copy.copy(self),
             tag=tag,
+            transform_meta=transform_meta,
         )
         # search through callers to find one of the match* methods
         frame = inspect.currentframe()
@@ -3,91 +3,135 @@ from __future__ import annotations
 
 import logging
 import sys
+from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from ansible.plugins.loader import module_loader
+from ruamel.yaml.comments import CommentedMap
 
 from ansiblelint.constants import LINE_NUMBER_KEY
+from ansiblelint.errors import RuleMatchTransformMeta
 from ansiblelint.rules import AnsibleLintRule, TransformMixin
 
 if TYPE_CHECKING:
-    from ruamel.yaml.comments import CommentedMap, CommentedSeq
+    from ruamel.yaml.comments import CommentedSeq
 
     from ansiblelint.errors import MatchError
     from ansiblelint.file_utils import Lintable
 
 _logger = logging.getLogger(__name__)
 
-builtins = [
-    "add_host",
-    "apt",
-    "apt_key",
-    "apt_repository",
-    "assemble",
-    "assert",
-    "async_status",
-    "blockinfile",
-    "command",
-    "copy",
-    "cron",
-    "debconf",
-    "debug",
-    "dnf",
-    "dpkg_selections",
-    "expect",
-    "fail",
-    "fetch",
-    "file",
-    "find",
-    "gather_facts",
-    "get_url",
-    "getent",
-    "git",
-    "group",
-    "group_by",
-    "hostname",
-    "import_playbook",
-    "import_role",
-    "import_tasks",
-    "include",
-    "include_role",
-    "include_tasks",
-    "include_vars",
-    "iptables",
-    "known_hosts",
-    "lineinfile",
-    "meta",
-    "package",
-    "package_facts",
-    "pause",
-    "ping",
-    "pip",
-    "raw",
-    "reboot",
-    "replace",
-    "rpm_key",
-    "script",
-    "service",
-    "service_facts",
-    "set_fact",
-    "set_stats",
-    "setup",
-    "shell",
-    "slurp",
-    "stat",
-    "subversion",
-    "systemd",
-    "sysvinit",
-    "tempfile",
-    "template",
-    "unarchive",
-    "uri",
-    "user",
-    "wait_for",
-    "wait_for_connection",
-    "yum",
-    "yum_repository",
-]
+builtins: frozenset[str] = frozenset(
+    {
+        "add_host",
+        "apt",
+        "apt_key",
+        "apt_repository",
+        "assemble",
+        "assert",
+        "async_status",
+        "blockinfile",
+        "command",
+        "copy",
+        "cron",
+        "debconf",
+        "debug",
+        "dnf",
+        "dpkg_selections",
+        "expect",
+        "fail",
+        "fetch",
+        "file",
+        "find",
+        "gather_facts",
+        "get_url",
+        "getent",
+        "git",
+        "group",
+        "group_by",
+        "hostname",
+        "import_playbook",
+        "import_role",
+        "import_tasks",
+        "include",
+        "include_role",
+        "include_tasks",
+        "include_vars",
+        "iptables",
+        "known_hosts",
+        "lineinfile",
+        "meta",
+        "package",
+        "package_facts",
+        "pause",
+        "ping",
+        "pip",
+        "raw",
+        "reboot",
+        "replace",
+        "rpm_key",
+        "script",
+        "service",
+        "service_facts",
+        "set_fact",
+        "set_stats",
+        "setup",
+        "shell",
+        "slurp",
+        "stat",
+        "subversion",
+        "systemd",
+        "sysvinit",
+        "tempfile",
+        "template",
+        "unarchive",
+        "uri",
+        "user",
+        "wait_for",
+        "wait_for_connection",
+        "yum",
+        "yum_repository",
+    },
+)
+# legacy names under which ansible also accepts the builtin modules
+_LEGACY_OF: dict[str, str] = {
+    f"ansible.builtin.{module}": f"ansible.legacy.{module}" for module in builtins
+}
+
+
+@cache
+def _resolve_fqcn(module: str) -> str:
+    """Return the canonical FQCN of a module, or the module itself if unresolved."""
+    if module == "block/always/rescue":
+        return module
+    target = module_loader.find_plugin_with_context(module).resolved_fqcn
+    if target is None:
+        _logger.warning("Unable to resolve FQCN for module %s", module)
+        return module
+    return str(target)
+
+
+@dataclass(frozen=True)
+class FQCNTransformMeta(RuleMatchTransformMeta):
+    """Action names needed to fix a fqcn match."""
+
+    current_action: str
+    new_action: str
+
+
+def _rename_key(mapping: dict[str, Any], old: str, new: str) -> None:
+    """Rename a mapping key in place, keeping its position and comments."""
+    if not isinstance(mapping, CommentedMap):
+        # plain dicts cannot insert at a position, so all keys are re-added
+        for key in list(mapping):
+            value = mapping.pop(key)
+            mapping[new if key == old else key] = value
+        return
+    position = list(mapping).index(old)
+    mapping.insert(position, new, mapping.pop(old))
+    if old in mapping.ca.items:
+        mapping.ca.items[new] = mapping.ca.items.pop(old)
 
 
 class FQCNBuiltinsRule(AnsibleLintRule, TransformMixin):
@@ -100,7 +144,6 @@ class FQCNBuiltinsRule(AnsibleLintRule, TransformMixin):
     )
     tags = ["formatting"]
     version_added = "v6.8.0"
-    module_aliases: dict[str, str] = {"block/always/rescue": "block/always/rescue"}
 
     def matchtask(
         self,
@@ -109,22 +152,11 @@ class FQCNBuiltinsRule(AnsibleLintRule, TransformMixin):
     ) -> list[MatchError]:
         result = []
         module = task["action"]["__ansible_module_original__"]
+        module_alias = _resolve_fqcn(module)
 
-        if module not in self.module_aliases:
-            loaded_module = module_loader.find_plugin_with_context(module)
-            target = loaded_module.resolved_fqcn
-            self.module_aliases[module] = target
-            if target is None:
-                _logger.warning("Unable to resolve FQCN for module %s", module)
-                self.module_aliases[module] = module
-                return []
-            if target not in self.module_aliases:
-                self.module_aliases[target] = target
-
-        if module != self.module_aliases[module]:
-            module_alias = self.module_aliases[module]
+        if module != module_alias:
             if module_alias.startswith("ansible.builtin"):
-                legacy_module = module_alias.replace(
+                legacy_module = _LEGACY_OF.get(module_alias) or module_alias.replace(
                     "ansible.builtin.",
                     "ansible.legacy.",
                     1,
@@ -137,17 +169,21 @@ class FQCNBuiltinsRule(AnsibleLintRule, TransformMixin):
                             filename=file,
                             lineno=task["__line__"],
                             tag="fqcn[action-core]",
+                            # This will always replace builtin modules with "ansible.builtin" versions, not "ansible.legacy".
+                            # The latter is technically more correct in what ansible has executed so far, the former is most likely better understood and more robust.
+                            transform_meta=FQCNTransformMeta(module, module_alias),
                         ),
                     )
             else:
                 if module.count(".") < 2:
                     result.append(
                         self.create_matcherror(
-                            message=f"Use FQCN for module actions, such `{self.module_aliases[module]}`.",
+                            message=f"Use FQCN for module actions, such `{module_alias}`.",
                             details=f"Action `{module}` is not FQCN.",
                             filename=file,
                             lineno=task["__line__"],
                             tag="fqcn[action]",
+                            transform_meta=FQCNTransformMeta(module, module_alias),
                         ),
                     )
                 # TODO(ssbarnea): Remove the c.g. and c.n. exceptions from here once
@@ -158,27 +194,26 @@ class FQCNBuiltinsRule(AnsibleLintRule, TransformMixin):
                 ):
                     result.append(
                         self.create_matcherror(
-                            message=f"You should use canonical module name `{self.module_aliases[module]}` instead of `{module}`.",
+                            message=f"You should use canonical module name `{module_alias}` instead of `{module}`.",
                             filename=file,
                             lineno=task["__line__"],
                             tag="fqcn[canonical]",
+                            transform_meta=FQCNTransformMeta(module, module_alias),
                         ),
                     )
         return result
 
     def matchplay(self, file: Lintable, data: dict[str, Any]) -> list[MatchError]:
-        if file.kind != "playbook":
+        if file.kind != "playbook" or "collections" not in data:
             return []
-        if "collections" in data:
-            return [
-                self.create_matcherror(
-                    message="Avoid `collections` keyword by using FQCN for all plugins, modules, roles and playbooks.",
-                    lineno=data[LINE_NUMBER_KEY],
-                    tag="fqcn[keyword]",
-                    filename=file,
-                ),
-            ]
-        return []
+        return [
+            self.create_matcherror(
+                message="Avoid `collections` keyword by using FQCN for all plugins, modules, roles and playbooks.",
+                lineno=data[LINE_NUMBER_KEY],
+                tag="fqcn[keyword]",
+                filename=file,
+            ),
+        ]
 
     def transform(
         self,
@@ -186,25 +221,17 @@ class FQCNBuiltinsRule(AnsibleLintRule, TransformMixin):
         lintable: Lintable,
         data: CommentedMap | CommentedSeq | str,
     ) -> None:
-        if match.tag in {"fqcn[action-core]", "fqcn[action]", "fqcn[canonical]"}:
+        if isinstance(match.transform_meta, FQCNTransformMeta):
             target_task = self.seek(match.yaml_path, data)
-            # Unfortunately, a lot of data about Ansible content gets lost here, you only get a simple dict.
-            # For now, just parse the error messages for the data about action names etc. and fix this later.
-            if match.tag == "fqcn[action-core]":
-                # split at the first bracket, cut off the last bracket and dot
-                current_action = match.message.split("(")[1][:-2]
-                # This will always replace builtin modules with "ansible.builtin" versions, not "ansible.legacy".
-                # The latter is technically more correct in what ansible has executed so far, the former is most likely better understood and more robust.
-                new_action = match.details.split("`")[1]
-            elif match.tag == "fqcn[action]":
-                current_action = match.details.split("`")[1]
-                new_action = match.message.split("`")[1]
-            elif match.tag == "fqcn[canonical]":
-                current_action = match.message.split("`")[3]
-                new_action = match.message.split("`")[1]
-            for _ in range(len(target_task)):
-                k, v = target_task.popitem(False)
-                target_task[new_action if k == current_action else k] = v
+            current_action = match.transform_meta.current_action
+            # actions given as `action:` or `local_action:` values are not keys
+            if current_action not in target_task:
+                return
+            _rename_key(
+                target_task,
+                current_action,
+                match.transform_meta.new_action,
+            )
             match.fixed = True
 
 
@@ -234,3 +261,13 @@ if "pytest" in sys.modules:
         success = "examples/playbooks/rule-fqcn-pass.yml"
         results = Runner(success, rules=collection).run()
         assert len(results) == 0, results
+
+    def test_fqcn_rename_key_plain_dict() -> None:
+        """Test renaming a key of a plain dict keeps keys order."""
+        task = {"name": "foo", "shell": "echo", "when": "bar"}
+        _rename_key(task, "shell", "ansible.builtin.shell")
+        assert list(task.items()) == [
+            ("name", "foo"),
+            ("ansible.builtin.shell", "echo"),
+            ("when", "bar"),
+        ]
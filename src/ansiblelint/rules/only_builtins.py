@@ -34,11 +34,11 @@ class OnlyBuiltinsRule(AnsibleLintRule):
             "ansible.legacy",
             *options.only_builtins_allow_collections,
         ]
-        allowed_modules = builtins + options.only_builtins_allow_modules
 
         is_allowed = (
             any(module.startswith(f"{prefix}.") for prefix in allowed_collections)
-            or module in allowed_modules
+            or module in builtins
+            or module in options.only_builtins_allow_modules
         )
 
         return not is_allowed and not is_nested_task(task)
@@ -166,18 +166,15 @@ class Runner:
             # remove duplicates from files list
             files = [value for n, value in enumerate(files) if value not in files[:n]]
 
-            for file in self.lintables:
-                if file in self.checked_files or not file.kind:
-                    continue
-                _logger.debug(
-                    "Examining %s of type %s",
-                    ansiblelint.file_utils.normpath(file.path),
-                    file.kind,
-                )
-
-                matches.extend(
-                    self.rules.run(file, tags=set(self.tags), skip_list=self.skip_list),
-                )
+            matches.extend(
+                self._run_rules(
+                    [
+                        file
+                        for file in self.lintables
+                        if file not in self.checked_files and file.kind
+                    ],
+                ),
+            )
 
         # update list of checked files
         self.checked_files.update(self.lintables)
@@ -194,6 +191,42 @@ class Runner:
 
         return sorted(set(matches))
 
+    def _run_rules(self, lintables: list[Lintable]) -> list[MatchError]:
+        """Run rules against lintables, in parallel when multiple processes are allowed."""
+        processes = self.rules.options.processes
+        if processes == 0:
+            processes = multiprocessing.cpu_count()
+        # workers are forked, so they inherit loaded rules and options without
+        # having to pickle them.
+        if (
+            not processes
+            or processes < 2
+            or len(lintables) < 2
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return [match for file in lintables for match in self.lint_file(file)]
+
+        with multiprocessing.get_context("fork").Pool(
+            processes=min(processes, len(lintables)),
+            initializer=_init_worker,
+            initargs=(self, lintables),
+        ) as pool:
+            return_list = pool.map(
+                _lint_file_in_worker,
+                range(len(lintables)),
+                chunksize=1,
+            )
+        return [match for data in return_list for match in data]
+
+    def lint_file(self, file: Lintable) -> list[MatchError]:
+        """Run rules against a single lintable."""
+        _logger.debug(
+            "Examining %s of type %s",
+            ansiblelint.file_utils.normpath(file.path),
+            file.kind,
+        )
+        return self.rules.run(file, tags=set(self.tags), skip_list=self.skip_list)
+
     def _emit_matches(self, files: list[Lintable]) -> Generator[MatchError, None, None]:
         visited: set[Lintable] = set()
         while visited != self.lintables:
@@ -215,6 +248,25 @@ class Runner:
                 visited.add(lintable)
 
 
+# Runner and lintables of the parent process, only set inside forked workers
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(runner: Runner, lintables: list[Lintable]) -> None:
+    """Keep the runner inherited from the parent process for later tasks."""
+    _worker_state["runner"] = runner
+    _worker_state["lintables"] = lintables
+
+
+def _lint_file_in_worker(index: int) -> list[MatchError]:
+    """Lint one of the lintables passed to the worker, identified by its index."""
+    if not _worker_state:  # pragma: no cover
+        msg = "Worker process was not initialized."
+        raise RuntimeError(msg)
+    runner: Runner = _worker_state["runner"]
+    return runner.lint_file(_worker_state["lintables"][index])
+
+
 def _get_matches(rules: RulesCollection, options: Options) -> LintResult:
     lintables = ansiblelint.utils.get_lintables(opts=options, args=options.lintables)
 
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import copy
 import os
-from typing import TYPE_CHECKING
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -52,7 +53,13 @@ def rule_runner(request: SubRequest, config_options: Options) -> RunFromText:
 @pytest.fixture(name="config_options")
 def fixture_config_options() -> Iterator[Options]:
     """Return configuration options that will be restored after testrun."""
-    global options  # pylint: disable=global-statement,invalid-name # noqa: PLW0603
-    original_options = copy.deepcopy(options)
+    original_options: dict[str, Any] = {}
+    for field in fields(options):
+        value = getattr(options, field.name)
+        # only containers can be altered in place, other values get replaced
+        if isinstance(value, (dict, list)):
+            value = copy.copy(value)
+        original_options[field.name] = value
     yield options
-    options = original_options
+    for name, value in original_options.items():
+        setattr(options, name, value)
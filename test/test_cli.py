@@ -225,3 +225,30 @@ def test_config_dev_null(base_arguments: list[str], config_file: str) -> None:
     """Ensures specific config files produce error code 3."""
     cfg = cli.get_config([*base_arguments, "-c", config_file])
     assert cfg.config_file == "/dev/null"
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    (
+        pytest.param(["-c", "/dev/null"], 1, id="default"),
+        pytest.param(["-c", "/dev/null", "--processes", "0"], 0, id="cli-all-cpus"),
+        pytest.param(["-c", "test/fixtures/processes-all-cpus.yml"], 0, id="file"),
+        pytest.param(
+            ["-c", "test/fixtures/processes-all-cpus.yml", "--processes", "2"],
+            2,
+            id="cli-over-file",
+        ),
+        pytest.param(
+            ["-c", "test/fixtures/config-with-extra-vars.yml"],
+            1,
+            id="file-without-processes",
+        ),
+    ),
+)
+def test_config_processes(
+    base_arguments: list[str],
+    args: list[str],
+    expected: int,
+) -> None:
+    """Ensure 0 processes is kept and a missing value defaults to 1."""
+    assert cli.get_config([*base_arguments, *args]).processes == expected
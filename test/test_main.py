@@ -4,12 +4,29 @@ import shutil
 import subprocess
 import sys
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from ansiblelint.config import get_version_warning
+from ansiblelint.config import (
+    VERSION_CHECK_EXIT_TIMEOUT,
+    _refresh_version_cache,
+    _refresh_version_cache_async,
+    get_version_warning,
+    options,
+)
+
+
+@pytest.fixture(name="clear_version_caches", autouse=True)
+def fixture_clear_version_caches() -> Iterator[None]:
+    """Do not let cached version check results leak between tests."""
+    get_version_warning.cache_clear()
+    _refresh_version_cache_async.cache_clear()
+    yield
+    get_version_warning.cache_clear()
+    _refresh_version_cache_async.cache_clear()
 
 
 @pytest.mark.parametrize(
@@ -65,9 +82,9 @@ def test_get_version_warning(
     """Assert get_version_warning working as expected."""
     data = f'{{"html_url": "https://127.0.0.1", "tag_name": "{ver_diff}"}}'
     # simulate cache file
-    mocker.patch("os.path.exists", return_value=True)
-    mocker.patch("os.path.getmtime", return_value=time.time())
+    mocker.patch("os.stat", return_value=os.stat_result((0,) * 7 + (time.time(),) * 3))
     mocker.patch("builtins.open", mocker.mock_open(read_data=data))
+    mocker.patch.object(options, "offline", False)
     # overwrite ansible-lint version
     mocker.patch("ansiblelint.config.__version__", "1.2.3")
     # overwrite install method to custom one. This one will increase msg line count
@@ -80,3 +97,57 @@ def test_get_version_warning(
     else:
         assert check in msg
     assert len(msg.split("\n")) == outlen
+
+
+def test_get_version_warning_offline(mocker: Any) -> None:
+    """Assert get_version_warning does not look for updates in offline mode."""
+    mocker.patch.object(options, "offline", True)
+    urlopen = mocker.patch("urllib.request.urlopen")
+    assert get_version_warning() == ""
+    urlopen.assert_not_called()
+
+
+def test_get_version_warning_stale_cache(mocker: Any) -> None:
+    """Assert a stale cache is still used while being refreshed in background."""
+    data = '{"html_url": "https://127.0.0.1", "tag_name": "v1.2.4"}'
+    mocker.patch("os.stat", return_value=os.stat_result((0,) * 10))
+    mocker.patch("builtins.open", mocker.mock_open(read_data=data))
+    mocker.patch.object(options, "offline", False)
+    mocker.patch("ansiblelint.config.__version__", "1.2.3")
+    mocker.patch("ansiblelint.config.guess_install_method", return_value="")
+    refresh = mocker.patch("ansiblelint.config._refresh_version_cache_async")
+    msg = get_version_warning()
+
+    assert "new release" in msg
+    refresh.assert_called_once()
+
+
+def test_refresh_version_cache(mocker: Any, tmp_path: Path) -> None:
+    """Assert refreshing the version cache stores the fetched release."""
+    cache_file = tmp_path / "ansible-lint" / "latest.json"
+    mocker.patch("ansiblelint.config.CACHE_DIR", cache_file.parent)
+    mocker.patch("ansiblelint.config.CACHE_FILE", cache_file)
+    urlopen = mocker.patch("urllib.request.urlopen")
+    urlopen.return_value.__enter__.return_value.read.return_value = (
+        b'{"tag_name": "v1.2.4"}'
+    )
+    _refresh_version_cache()
+
+    assert cache_file.read_text(encoding="utf-8") == '{"tag_name": "v1.2.4"}'
+    # cache is replaced atomically, without leftover temporary or lock files
+    assert list(cache_file.parent.iterdir()) == [cache_file]
+    assert urlopen.call_args.kwargs["timeout"] == 5
+
+
+def test_refresh_version_cache_async_waits_at_exit(mocker: Any) -> None:
+    """Assert the background refresh gets a bounded time to finish at exit."""
+    mocker.patch.object(options, "offline", False)
+    mocker.patch("ansiblelint.config._read_version_cache", return_value=({}, False))
+    thread: Any = mocker.patch("threading.Thread").return_value
+    register = mocker.patch("atexit.register")
+
+    # the refresh happens at most once per run
+    results = [_refresh_version_cache_async(), _refresh_version_cache_async()]
+    thread.start.assert_called_once()
+    register.assert_called_once_with(thread.join, VERSION_CHECK_EXIT_TIMEOUT)
+    assert results == [thread, thread]
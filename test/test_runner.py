@@ -20,6 +20,7 @@
 # THE SOFTWARE.
 from __future__ import annotations
 
+import multiprocessing
 import os
 from typing import TYPE_CHECKING, Any
 
@@ -30,6 +31,7 @@ from ansiblelint.file_utils import Lintable, abspath
 from ansiblelint.runner import Runner
 
 if TYPE_CHECKING:
+    from ansiblelint.config import Options
     from ansiblelint.rules import RulesCollection
 
 LOTS_OF_WARNINGS_PLAYBOOK = abspath(
@@ -171,3 +173,33 @@ def test_files_not_scanned_twice(default_rules_collection: RulesCollection) -> N
     # this second run should return 0 because the included filed was already
     # processed and added to checked_files, which acts like a bypass list.
     assert len(run2) == 0
+
+
+@pytest.mark.parametrize(
+    "processes",
+    (pytest.param(2, id="two"), pytest.param(0, id="all-cpus")),
+)
+def test_runner_processes(
+    default_rules_collection: RulesCollection,
+    config_options: Options,
+    mocker: Any,
+    processes: int,
+) -> None:
+    """Test that rules running in multiple processes produce the same matches."""
+    playbooks = (
+        "examples/playbooks/example.yml",
+        "examples/playbooks/rule-fqcn-fail.yml",
+        "examples/playbooks/rule-no-handler-fail.yml",
+    )
+    matches = Runner(*playbooks, rules=default_rules_collection).run()
+
+    # ensure the pool is used even on machines with a single cpu
+    mocker.patch("multiprocessing.cpu_count", return_value=2)
+    pool = mocker.spy(multiprocessing.get_context("fork"), "Pool")
+    config_options.processes = processes
+    parallel_matches = Runner(*playbooks, rules=default_rules_collection).run()
+
+    pool.assert_called_once()
+    assert pool.call_args.kwargs["processes"] == 2
+    assert parallel_matches == matches
+    assert {match.filename for match in matches} == set(playbooks)